@@ -0,0 +1,108 @@
+"""Sentence-aware, token-budgeted chunking of policy text for RAG indexing."""
+import re
+from typing import List, Tuple
+
+# Sentence boundaries: whitespace after terminal punctuation, or a line break
+SENTENCE_BOUNDARY_RE = re.compile(r'((?<=[.!?])[ \t]+|\s*\n\s*)')
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences, each keeping its trailing separator (a space or a newline)."""
+    parts = SENTENCE_BOUNDARY_RE.split(text.strip())
+    sentences = []
+    for k in range(0, len(parts), 2):
+        separator = parts[k + 1] if k + 1 < len(parts) else ''
+        if parts[k]:
+            sentences.append(parts[k] + ('\n' if '\n' in separator else ' ' if separator else ''))
+    return sentences
+
+def split_oversize_sentence(sentence: str, offsets: List[Tuple[int, int]], max_tokens: int) -> List[Tuple[str, int]]:
+    """Split a sentence over the token budget into (text, token count) pieces of at most max_tokens.
+
+    Cuts fall on token boundaries from the tokenizer's offset mapping, preferring a token
+    that starts a word, so long runs without spaces (e.g. ____ form lines) are still split.
+    """
+    pieces = []
+    k = 0
+    while k < len(offsets):
+        cut = min(k + max_tokens, len(offsets))
+        if cut < len(offsets):
+            # Walk back to a word start, but not so far that the piece becomes tiny
+            word_cut = cut
+            while word_cut > k + max_tokens // 2 and not sentence[offsets[word_cut][0] - 1].isspace():
+                word_cut -= 1
+            if word_cut > k and sentence[offsets[word_cut][0] - 1].isspace():
+                cut = word_cut
+        end = offsets[cut][0] if cut < len(offsets) else len(sentence)
+        pieces.append((sentence[offsets[k][0]:end], cut - k))
+        k = cut
+    return pieces
+
+def chunk_sentences(sentences: List[str], tokenizer, max_tokens: int, overlap_tokens: int) -> List[Tuple[int, str]]:
+    """Pack sentences into chunks of at most max_tokens tokens without breaking mid-sentence.
+
+    Roughly overlap_tokens worth of trailing sentences are repeated at the start of the
+    next chunk. `tokenizer` is a Hugging Face fast tokenizer (or anything with the same
+    batch call and offset mapping). Returns (index of the chunk's first sentence, chunk
+    text) pairs; chunks are never empty.
+    """
+    if not sentences:
+        return []
+    encoded = tokenizer(sentences, add_special_tokens=False, return_offsets_mapping=True)
+
+    # Sentences over the budget on their own are split on token boundaries
+    units = []
+    for idx, (sentence, offsets) in enumerate(zip(sentences, encoded['offset_mapping'])):
+        if len(offsets) <= max_tokens:
+            units.append((idx, sentence, len(offsets)))
+        else:
+            units.extend((idx, text, n) for text, n in split_oversize_sentence(sentence, offsets, max_tokens))
+
+    chunks = []
+    current = []
+    current_tokens = 0
+    for unit in units:
+        if current and current_tokens + unit[2] > max_tokens:
+            chunks.append((current[0][0], ''.join(u[1] for u in current).strip()))
+            carry = []
+            carry_tokens = 0
+            for u in reversed(current):
+                if carry_tokens + u[2] > overlap_tokens:
+                    break
+                carry.insert(0, u)
+                carry_tokens += u[2]
+            if carry_tokens + unit[2] > max_tokens:
+                carry, carry_tokens = [], 0
+            current, current_tokens = carry, carry_tokens
+        current.append(unit)
+        current_tokens += unit[2]
+    if current:
+        chunks.append((current[0][0], ''.join(u[1] for u in current).strip()))
+    return [(start, text) for start, text in chunks if text]
+
+def chunk_policy_content(content: str, tokenizer, max_tokens: int, overlap_tokens: int) -> List[Tuple[str, int, str]]:
+    """Chunk policy text by section. Returns (section, estimated page, chunk text) triples."""
+    # Group paragraphs into sections of sentences, tracking each sentence's estimated page
+    sections = [("General", [], [])]
+    page_num = 1
+
+    for i, para in enumerate(content.split('\n\n')):
+        if len(para.strip()) < 50:
+            # Might be a section header
+            if para.strip():
+                sections.append((para.strip()[:100], [], []))
+            continue
+
+        # Estimate page number
+        if i > 0 and i % 10 == 0:
+            page_num += 1
+
+        sentences = split_sentences(para)
+        sentences[-1] = sentences[-1].rstrip() + '\n\n'
+        sections[-1][1].extend(sentences)
+        sections[-1][2].extend([page_num] * len(sentences))
+
+    chunks = []
+    for section, sentences, pages in sections:
+        for start, text in chunk_sentences(sentences, tokenizer, max_tokens, overlap_tokens):
+            chunks.append((section, pages[start], text))
+    return chunks
@@ -0,0 +1,55 @@
+"""Locating and parsing JSON values embedded in LLM responses."""
+import json
+from typing import Any
+
+JSON_DECODER = json.JSONDecoder()
+
+CLOSERS = {'{': '}', '[': ']'}
+
+def bracket_span_end(text: str, start: int) -> int:
+    """Index just past the bracket that closes the one at `start`, or -1 if it never closes.
+
+    Brackets inside JSON strings are ignored, so a truncated value spans to the end of the text.
+    """
+    stack = []
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c in CLOSERS:
+            stack.append(CLOSERS[c])
+        elif c in ('}', ']'):
+            if not stack or c != stack.pop():
+                return -1
+            if not stack:
+                return i + 1
+    return -1
+
+def extract_json(text: str, opener: str = '{') -> Any:
+    """Parse the first complete JSON value starting with `opener` in an LLM response.
+
+    Returns None if `opener` never appears; raises json.JSONDecodeError if no
+    candidate position holds valid JSON. After a candidate fails, the search
+    resumes only past the end of its bracketed region, so a truncated or
+    malformed value is never replaced by a fragment nested inside it.
+    """
+    i = text.find(opener)
+    if i < 0:
+        return None
+    while True:
+        try:
+            return JSON_DECODER.raw_decode(text, i)[0]
+        except json.JSONDecodeError:
+            end = bracket_span_end(text, i)
+            i = text.find(opener, end) if end > 0 else -1
+            if i < 0:
+                raise
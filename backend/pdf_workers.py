@@ -0,0 +1,106 @@
+"""Worker entry points for the PDF process pool (OCR, text-layer parsing, rendering).
+
+Pool workers are spawned, so they import only this module; keep it free of the
+API's heavier dependencies (torch, sentence-transformers, Motor, FastAPI).
+"""
+import os
+import re
+import threading
+from typing import List, Tuple
+
+# Tesseract's OpenMP threading scales poorly, so each worker runs it single-threaded;
+# must be set before tesserocr loads
+os.environ['OMP_THREAD_LIMIT'] = '1'
+
+import tesserocr
+from PIL import Image
+from PyPDF2 import PdfReader
+from pdf2image import convert_from_path
+from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
+
+# Print stylesheet for exported appeal letters, passed to WeasyPrint directly
+APPEAL_PRINT_CSS = """
+body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
+.header { text-align: center; margin-bottom: 30px; border-bottom: 2px solid #0F766E; padding-bottom: 20px; }
+.disclaimer { background: #FEF3C7; padding: 15px; border-left: 4px solid #F59E0B; margin-bottom: 20px; font-size: 12px; }
+.content { white-space: pre-wrap; }
+.footer { margin-top: 30px; font-size: 11px; color: #666; border-top: 1px solid #ddd; padding-top: 15px; }
+.citation { background: #F0FDFA; padding: 3px 6px; font-size: 11px; }
+"""
+
+# External stylesheets and scripts are never needed for exports; strip any that reach the HTML
+EXTERNAL_ASSET_RE = re.compile(r'<link\b[^>]*>|<script\b[^>]*>.*?</script\s*>', re.IGNORECASE | re.DOTALL)
+
+# Per-process Tesseract handle; the language model is loaded once per OCR worker
+tess_api = None
+tess_lock = threading.Lock()
+
+def get_tess_api() -> tesserocr.PyTessBaseAPI:
+    global tess_api
+    if tess_api is None:
+        tess_api = tesserocr.PyTessBaseAPI(lang='eng', psm=tesserocr.PSM.AUTO, oem=tesserocr.OEM.LSTM_ONLY)
+    return tess_api
+
+def ocr_image(image_path: str) -> str:
+    """OCR a single image file."""
+    img = Image.open(image_path)
+    # PyTessBaseAPI is not thread-safe
+    with tess_lock:
+        api = get_tess_api()
+        api.SetImage(img)
+        return api.GetUTF8Text()
+
+def page_runs(page_numbers: List[int]) -> List[Tuple[int, int]]:
+    """Group sorted 1-based page numbers into (first, last) runs of consecutive pages."""
+    runs = []
+    for n in page_numbers:
+        if runs and n == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], n)
+        else:
+            runs.append((n, n))
+    return runs
+
+def ocr_pdf_pages(pdf_path: str, page_numbers: List[int]) -> List[str]:
+    """Rasterize and OCR the given PDF pages."""
+    texts = []
+    with tess_lock:
+        api = get_tess_api()
+        for first, last in page_runs(page_numbers):
+            images = convert_from_path(
+                pdf_path, dpi=200, fmt='jpeg', grayscale=True, first_page=first, last_page=last
+            )
+            # Hand the PIL image straight to Tesseract; no re-encode between Poppler and OCR
+            for img in images:
+                api.SetImage(img)
+                texts.append(api.GetUTF8Text())
+    return texts
+
+def read_pdf_pages(pdf_path: str) -> List[str]:
+    """Extract the text layer of each PDF page."""
+    pdf_reader = PdfReader(pdf_path)
+    return [page.extract_text() or "" for page in pdf_reader.pages]
+
+def local_url_fetcher(url: str, *args, **kwargs):
+    """Refuse remote asset fetches; exported HTML is self-contained."""
+    raise ValueError(f"External resource not allowed in PDF export: {url}")
+
+# Per-process WeasyPrint state; font discovery and CSS parsing happen once per worker
+pdf_font_config = None
+pdf_print_css = None
+
+def get_pdf_print_css() -> Tuple[CSS, FontConfiguration]:
+    global pdf_font_config, pdf_print_css
+    if pdf_print_css is None:
+        pdf_font_config = FontConfiguration()
+        pdf_print_css = CSS(string=APPEAL_PRINT_CSS, font_config=pdf_font_config)
+    return pdf_print_css, pdf_font_config
+
+def render_pdf(html_content: str) -> bytes:
+    """Render HTML to PDF bytes."""
+    html_content = EXTERNAL_ASSET_RE.sub('', html_content)
+    print_css, font_config = get_pdf_print_css()
+    return HTML(string=html_content, url_fetcher=local_url_fetcher).write_pdf(
+        stylesheets=[print_css],
+        font_config=font_config
+    )
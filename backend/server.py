@@ -1,58 +1,119 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, Form, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, Form, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReadPreference, ReplaceOne, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from bson.binary import Binary
 from starlette.responses import StreamingResponse
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import uuid
 from datetime import datetime, timezone, timedelta
 import jwt
 import bcrypt
 import json
+import copy
+import hashlib
 import asyncio
 import io
+import threading
+import time
 import re
-from PyPDF2 import PdfReader
-import pytesseract
-from PIL import Image
-from pdf2image import convert_from_bytes
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+from pdf2image import pdfinfo_from_path
+import aiofiles
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+import torch
 from sentence_transformers import SentenceTransformer
+from emergentintegrations.llm.chat import LlmChat, UserMessage
+from pdf_workers import ocr_image, ocr_pdf_pages, read_pdf_pages, render_pdf
+from chunking import chunk_policy_content
+from llm_json import extract_json
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ.get('MONGO_URL')
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', '100')))
 db = client[os.environ.get('DB_NAME')]
 
+# Reporting reads tolerate replica lag, so they prefer secondaries (a standalone server just serves them)
+reporting_cases = db.cases.with_options(read_preference=ReadPreference.SECONDARY_PREFERRED)
+reporting_audit_logs = db.audit_logs.with_options(read_preference=ReadPreference.SECONDARY_PREFERRED)
+
 # JWT Configuration
 JWT_SECRET = os.environ.get('JWT_SECRET', 'authpilot_secret_key_2024')
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', '12'))
 
 # LLM Configuration
 EMERGENT_LLM_KEY = os.environ.get('EMERGENT_LLM_KEY')
+LLM_PROVIDER = "openai"
+LLM_MODEL = "gpt-5.2"
 
 # Upload directory
 UPLOAD_DIR = ROOT_DIR / 'uploads'
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+# Worker pool for CPU-heavy PDF work (OCR, text-layer parsing and WeasyPrint
+# rendering). Workers are spawned and run functions from pdf_workers, so they
+# never import this module or its model dependencies.
+PDF_WORKERS = min(8, os.cpu_count() or 1)
+
+def create_pdf_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=PDF_WORKERS,
+        mp_context=multiprocessing.get_context('spawn')
+    )
+
+PDF_POOL = create_pdf_pool()
+
 # Initialize sentence transformer for embeddings
+# EMBEDDING_BACKEND=onnx serves the int8-quantized ONNX export through ONNX Runtime
+# (requires sentence-transformers[onnx]); the default is the PyTorch model.
+EMBEDDING_BACKEND = os.environ.get('EMBEDDING_BACKEND', 'torch')
+EMBEDDING_ONNX_FILE = os.environ.get('EMBEDDING_ONNX_FILE', 'onnx/model_qint8_avx512_vnni.onnx')
 embedding_model = None
 
-def get_embedding_model():
-    global embedding_model
-    if embedding_model is None:
-        embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-    return embedding_model
+def load_embedding_model() -> SentenceTransformer:
+    """Load the embedding model once and warm it so the first request does not pay for it."""
+    torch.set_num_threads(min(8, os.cpu_count() or 1))
+    if EMBEDDING_BACKEND == 'onnx':
+        model = SentenceTransformer(
+            'all-MiniLM-L6-v2',
+            backend='onnx',
+            model_kwargs={'file_name': EMBEDDING_ONNX_FILE}
+        )
+    else:
+        model = SentenceTransformer('all-MiniLM-L6-v2')
+        model.eval()
+    model.encode(['warmup'], show_progress_bar=False)
+    return model
+
+# Separate copy of the model's tokenizer, used only to count chunk tokens
+chunk_tokenizer = None
+
+def load_chunk_tokenizer(model: SentenceTransformer):
+    """Copy the model's tokenizer for chunking.
+    
+    Token counting runs without truncation or padding, and a fast tokenizer keeps those
+    settings on its Rust backend; sharing it would flip them under concurrent encodes
+    (or fail with "Already borrowed"). The warm call applies the counting settings once,
+    so later chunking calls never mutate the copy either.
+    """
+    tokenizer = copy.deepcopy(model.tokenizer)
+    tokenizer(['warmup'], add_special_tokens=False, return_offsets_mapping=True)
+    return tokenizer
 
 # Create the main app
 app = FastAPI(title="AuthPilot API")
@@ -126,11 +187,13 @@ class AuditLogEntry(BaseModel):
     details: Optional[Dict[str, Any]] = None
 
 # Helper Functions
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+# bcrypt is CPU-bound; run it on the thread pool so it does not block the event loop
+async def hash_password(password: str) -> str:
+    hashed = await asyncio.to_thread(bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(BCRYPT_ROUNDS))
+    return hashed.decode('utf-8')
 
-def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+async def verify_password(password: str, hashed: str) -> bool:
+    return await asyncio.to_thread(bcrypt.checkpw, password.encode('utf-8'), hashed.encode('utf-8'))
 
 def create_token(user_id: str, email: str) -> str:
     payload = {
@@ -153,9 +216,59 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+# Audit log writes are queued and flushed in batches by a background task,
+# keeping the MongoDB round-trip off each request's critical path
+AUDIT_BATCH_SIZE = 500
+AUDIT_RETRY_MAX_DELAY_SECONDS = 30
+audit_queue: asyncio.Queue = asyncio.Queue(maxsize=10000)
+audit_drain_task: Optional[asyncio.Task] = None
+
+async def flush_audit_logs(batch: List[Dict]):
+    """Write a batch of audit entries, retrying with backoff until every entry is stored.
+    
+    Entries use their id as _id, so a retry after a partial write skips the entries
+    that already landed (duplicate key errors count as stored).
+    """
+    pending = batch
+    delay = 0.5
+    while True:
+        try:
+            await db.audit_logs.insert_many(pending, ordered=False)
+            return
+        except BulkWriteError as e:
+            failed = [pending[err['index']] for err in e.details.get('writeErrors', []) if err.get('code') != 11000]
+            if e.details.get('writeConcernErrors'):
+                # Unknown which entries were acknowledged; retry them all, duplicates are skipped
+                failed = pending
+            if not failed:
+                return
+            logging.error(f"Audit log write error, retrying {len(failed)} entries in {delay}s: {e}")
+            pending = failed
+        except Exception as e:
+            logging.error(f"Audit log write error, retrying {len(pending)} entries in {delay}s: {e}")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, AUDIT_RETRY_MAX_DELAY_SECONDS)
+
+async def drain_audit_queue():
+    while True:
+        batch = [await audit_queue.get()]
+        while len(batch) < AUDIT_BATCH_SIZE and not audit_queue.empty():
+            batch.append(audit_queue.get_nowait())
+        try:
+            await flush_audit_logs(batch)
+        except asyncio.CancelledError:
+            logging.error(f"Audit log drain stopped with {len(batch)} entries unwritten")
+            raise
+        # Entries count as done only once stored, so shutdown's join() waits for them
+        for _ in batch:
+            audit_queue.task_done()
+        await asyncio.sleep(0.05)
+
 async def create_audit_log(user_id: str, organization_id: str, action: str, case_id: str = None, details: dict = None):
+    log_id = str(uuid.uuid4())
     log_entry = {
-        'id': str(uuid.uuid4()),
+        '_id': log_id,
+        'id': log_id,
         'user_id': user_id,
         'organization_id': organization_id,
         'case_id': case_id,
@@ -163,53 +276,106 @@ async def create_audit_log(user_id: str, organization_id: str, action: str, case
         'details': details or {},
         'timestamp': datetime.now(timezone.utc).isoformat()
     }
-    await db.audit_logs.insert_one(log_entry)
+    try:
+        audit_queue.put_nowait(log_entry)
+    except asyncio.QueueFull:
+        # Never drop audit entries; fall back to a direct write under backpressure
+        await db.audit_logs.insert_one(log_entry)
+
+async def run_in_pdf_pool(fn, *args):
+    """Run fn in PDF_POOL, restarting the pool once if a dead worker has broken it."""
+    global PDF_POOL
+    loop = asyncio.get_running_loop()
+    pool = PDF_POOL
+    try:
+        return await loop.run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        # Concurrent callers on the same broken pool restart it only once
+        if PDF_POOL is pool:
+            logging.error("PDF worker pool is broken (a worker died); restarting it")
+            PDF_POOL = create_pdf_pool()
+            pool.shutdown(wait=False, cancel_futures=True)
+    try:
+        return await loop.run_in_executor(PDF_POOL, fn, *args)
+    except BrokenProcessPool:
+        raise HTTPException(status_code=503, detail="Document processing is temporarily unavailable, please retry")
+
+async def ocr_pdf(pdf_path: str, page_numbers: Optional[List[int]] = None) -> List[str]:
+    """OCR PDF pages (1-based, all pages if None) in parallel across the OCR pool."""
+    if page_numbers is None:
+        info = await asyncio.to_thread(pdfinfo_from_path, pdf_path)
+        page_numbers = list(range(1, info['Pages'] + 1))
+    if not page_numbers:
+        return []
+    
+    # One contiguous slice of pages per worker; each worker rasterizes its pages straight from disk
+    page_numbers = sorted(page_numbers)
+    slice_size = -(-len(page_numbers) // PDF_WORKERS)
+    slices = [page_numbers[i:i + slice_size] for i in range(0, len(page_numbers), slice_size)]
+    
+    results = await asyncio.gather(*[run_in_pdf_pool(ocr_pdf_pages, pdf_path, pages) for pages in slices])
+    return [text for texts in results for text in texts]
 
-def extract_text_from_pdf(file_bytes: bytes) -> str:
-    """Extract text from PDF, with OCR fallback for scanned documents."""
-    text = ""
+async def extract_text_from_pdf(pdf_path: str) -> str:
+    """Extract text from PDF, with OCR fallback for scanned pages."""
     try:
-        pdf_reader = PdfReader(io.BytesIO(file_bytes))
-        for page in pdf_reader.pages:
-            page_text = page.extract_text() or ""
-            text += page_text + "\n"
-        
-        # If very little text extracted, try OCR
-        if len(text.strip()) < 100:
-            images = convert_from_bytes(file_bytes)
-            for img in images:
-                text += pytesseract.image_to_string(img) + "\n"
+        # PyPDF2 is pure Python and holds the GIL, so parse in a worker process rather than a thread
+        page_texts = await run_in_pdf_pool(read_pdf_pages, pdf_path)
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"PDF extraction error: {e}")
         # Fallback to OCR only
         try:
-            images = convert_from_bytes(file_bytes)
-            for img in images:
-                text += pytesseract.image_to_string(img) + "\n"
+            return "\n".join(await ocr_pdf(pdf_path)).strip()
+        except HTTPException:
+            raise
+        except Exception as ocr_e:
+            logging.error(f"OCR fallback error: {ocr_e}")
+            return ""
+    
+    # OCR only the pages without a usable text layer
+    blank_pages = [i for i, t in enumerate(page_texts) if len(t.strip()) < 20]
+    if blank_pages:
+        try:
+            ocr_texts = await ocr_pdf(pdf_path, [i + 1 for i in blank_pages])
+            for i, page_text in zip(blank_pages, ocr_texts):
+                page_texts[i] = page_text
+        except HTTPException:
+            raise
         except Exception as ocr_e:
             logging.error(f"OCR fallback error: {ocr_e}")
     
-    return text.strip()
+    return "\n".join(page_texts).strip()
 
-def extract_text_from_image(file_bytes: bytes) -> str:
+async def extract_text_from_image(image_path: str) -> str:
     """Extract text from image using OCR."""
     try:
-        img = Image.open(io.BytesIO(file_bytes))
-        return pytesseract.image_to_string(img)
+        return await run_in_pdf_pool(ocr_image, image_path)
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Image OCR error: {e}")
         return ""
 
+async def save_upload(file: UploadFile, file_path: Path, chunk_size: int = 64 * 1024):
+    """Stream an uploaded file to disk without holding it in memory."""
+    async with aiofiles.open(file_path, 'wb') as out:
+        while chunk := await file.read(chunk_size):
+            await out.write(chunk)
+
 async def call_llm(system_prompt: str, user_prompt: str) -> str:
     """Call OpenAI GPT via emergentintegrations."""
     try:
-        from emergentintegrations.llm.chat import LlmChat, UserMessage
-        
+        # A chat carries its message history, so each call gets a fresh session;
+        # reusing one across requests would leak case data between organizations.
+        # The system prompt stays byte-identical per route, so the provider can
+        # still cache the shared prefix.
         chat = LlmChat(
             api_key=EMERGENT_LLM_KEY,
             session_id=str(uuid.uuid4()),
             system_message=system_prompt
-        ).with_model("openai", "gpt-5.2")
+        ).with_model(LLM_PROVIDER, LLM_MODEL)
         
         response = await chat.send_message(UserMessage(text=user_prompt))
         return response
@@ -217,80 +383,210 @@ async def call_llm(system_prompt: str, user_prompt: str) -> str:
         logging.error(f"LLM call error: {e}")
         raise HTTPException(status_code=500, detail=f"LLM processing error: {str(e)}")
 
+# LRU of embeddings keyed by a hash of the embedded text; the batch path fills it from a worker thread
+EMBEDDING_CACHE_SIZE = int(os.environ.get('EMBEDDING_CACHE_SIZE', '10000'))
+embedding_cache: OrderedDict = OrderedDict()
+embedding_cache_lock = threading.Lock()
+
+def embedding_cache_key(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def get_cached_embedding(key: str) -> Optional[np.ndarray]:
+    with embedding_cache_lock:
+        embedding = embedding_cache.get(key)
+        if embedding is not None:
+            embedding_cache.move_to_end(key)
+        return embedding
+
+def put_cached_embedding(key: str, embedding: np.ndarray):
+    with embedding_cache_lock:
+        embedding_cache[key] = embedding
+        embedding_cache.move_to_end(key)
+        while len(embedding_cache) > EMBEDDING_CACHE_SIZE:
+            embedding_cache.popitem(last=False)
+
 def compute_embedding(text: str) -> List[float]:
-    """Compute embedding for text using sentence-transformers."""
-    model = get_embedding_model()
-    return model.encode(text).tolist()
+    """Compute L2-normalized embedding for text using sentence-transformers."""
+    key = embedding_cache_key(text)
+    embedding = get_cached_embedding(key)
+    if embedding is None:
+        embedding = embedding_model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
+        put_cached_embedding(key, embedding)
+    return embedding.tolist()
+
+def compute_embeddings_batch(texts: List[str]) -> np.ndarray:
+    """Compute L2-normalized embeddings for many texts in one batched encode, skipping cached texts."""
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+    keys = [embedding_cache_key(text) for text in texts]
+    embeddings = [get_cached_embedding(key) for key in keys]
+    
+    # Encode each distinct uncached text once
+    misses = {}
+    for key, text, embedding in zip(keys, texts, embeddings):
+        if embedding is None:
+            misses.setdefault(key, text)
+    if misses:
+        encoded = embedding_model.encode(
+            list(misses.values()),
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        for key, embedding in zip(misses, encoded):
+            # Copy the row; a view would keep the whole batch matrix alive after eviction
+            put_cached_embedding(key, embedding.copy())
+        computed = dict(zip(misses, encoded))
+        embeddings = [computed[key] if embedding is None else embedding for key, embedding in zip(keys, embeddings)]
+    return np.stack(embeddings)
+
+# Storage format of newly indexed chunk embeddings
+EMBEDDING_DTYPE = 'int8'
+
+def encode_embedding(embedding: np.ndarray) -> Dict[str, Any]:
+    """Quantize an embedding to int8 with a per-vector scale, packed as raw bytes for storage."""
+    embedding = np.asarray(embedding, dtype=np.float32)
+    scale = float(np.max(np.abs(embedding))) / 127 or 1.0
+    quantized = np.round(embedding / scale).astype(np.int8)
+    return {
+        'embedding': Binary(quantized.tobytes()),
+        'embedding_dtype': EMBEDDING_DTYPE,
+        'embedding_scale': scale
+    }
 
-async def search_policies(query: str, payer: str, state: str, top_k: int = 5) -> List[Dict]:
-    """Search policies using semantic similarity with metadata filtering."""
-    # Get all policy chunks for the payer/state
+def decode_embedding(chunk: Dict) -> np.ndarray:
+    """Unpack a stored chunk embedding, accepting older float16 and float array formats."""
+    if chunk.get('embedding_dtype') == 'int8':
+        return np.frombuffer(chunk['embedding'], dtype=np.int8).astype(np.float32) * chunk['embedding_scale']
+    if chunk.get('embedding_dtype') == 'float16':
+        return np.frombuffer(chunk['embedding'], dtype=np.float16)
+    # Legacy embeddings were stored unnormalized
+    embedding = np.asarray(chunk['embedding'], dtype=np.float32)
+    return embedding / (np.linalg.norm(embedding) + 1e-12)
+
+# In-process policy search index: (payer, state) -> (loaded at, normalized embedding matrix, chunk ids).
+# Entries expire after POLICY_INDEX_TTL_SECONDS so every server process picks up
+# policies indexed by other processes; local writes invalidate immediately.
+POLICY_INDEX_TTL_SECONDS = float(os.environ.get('POLICY_INDEX_TTL_SECONDS', '300'))
+policy_index: Dict[Tuple[str, str], Tuple[float, np.ndarray, List[str]]] = {}
+policy_index_generation = 0
+
+def invalidate_policy_index():
+    """Drop cached policy search indexes after policy chunks change."""
+    global policy_index_generation
+    policy_index_generation += 1
+    policy_index.clear()
+
+async def load_policy_index(payer: str, state: str) -> Tuple[np.ndarray, List[str]]:
+    """Return the search index for a payer/state filter, building it from MongoDB on a cold key."""
+    key = ((payer or '').strip().lower(), (state or '').strip().lower())
+    entry = policy_index.get(key)
+    if entry and time.monotonic() - entry[0] < POLICY_INDEX_TTL_SECONDS:
+        return entry[1], entry[2]
+    
+    generation = policy_index_generation
     filter_query = {}
     if payer:
-        filter_query['payer'] = {'$regex': payer, '$options': 'i'}
+        filter_query['payer_lc'] = payer.strip().lower()
     if state:
-        filter_query['state'] = {'$regex': state, '$options': 'i'}
+        filter_query['state_lc'] = state.strip().lower()
+    
+    # Only ids and vectors are needed for scoring; chunk text is fetched for the top hits only
+    chunks = await db.policy_chunks.find(filter_query, {'_id': 0, 'id': 1, 'embedding': 1, 'embedding_dtype': 1, 'embedding_scale': 1}).to_list(5000)
+    chunks = [chunk for chunk in chunks if 'embedding' in chunk]
+    chunk_ids = [chunk['id'] for chunk in chunks]
+    
+    if chunks:
+        emb_matrix = np.stack([decode_embedding(chunk) for chunk in chunks]).astype(np.float32)
+    else:
+        emb_matrix = np.empty((0, 0), dtype=np.float32)
     
-    chunks = await db.policy_chunks.find(filter_query, {'_id': 0}).to_list(1000)
+    # Skip caching if policy chunks were modified while this index was loading
+    if generation == policy_index_generation:
+        policy_index[key] = (time.monotonic(), emb_matrix, chunk_ids)
+    return emb_matrix, chunk_ids
+
+async def search_policies(query: str, payer: str, state: str, top_k: int = 5) -> List[Dict]:
+    """Search policies using semantic similarity with metadata filtering."""
+    emb_matrix, chunk_ids = await load_policy_index(payer, state)
     
-    if not chunks:
+    if not chunk_ids:
         return []
     
     # Compute query embedding
-    query_embedding = compute_embedding(query)
+    query_vec = np.asarray(compute_embedding(query), dtype=np.float32)
+    
+    # Embeddings are normalized at generation, so cosine similarity is a plain dot product
+    scores = emb_matrix @ query_vec
+    
+    # Select top_k without sorting the full score vector
+    if len(scores) > top_k:
+        top_idx = np.argpartition(-scores, top_k)[:top_k]
+    else:
+        top_idx = np.arange(len(scores))
+    top_idx = top_idx[np.argsort(-scores[top_idx])]
+    
+    top_ids = [chunk_ids[idx] for idx in top_idx]
+    top_chunks = await db.policy_chunks.find({'id': {'$in': top_ids}}, {'_id': 0, 'embedding': 0}).to_list(len(top_ids))
+    chunks_by_id = {chunk['id']: chunk for chunk in top_chunks}
     
-    # Compute similarities
     results = []
-    for chunk in chunks:
-        if 'embedding' in chunk:
-            similarity = cosine_similarity([query_embedding], [chunk['embedding']])[0][0]
-            results.append({
-                'policy_id': chunk.get('policy_id'),
-                'policy_name': chunk.get('policy_name'),
-                'effective_date': chunk.get('effective_date'),
-                'section': chunk.get('section'),
-                'page': chunk.get('page'),
-                'excerpt_id': chunk.get('id'),
-                'text': chunk.get('text'),
-                'score': float(similarity)
-            })
-    
-    # Sort by similarity and return top_k
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return results[:top_k]
+    for idx in top_idx:
+        chunk = chunks_by_id.get(chunk_ids[idx])
+        if chunk is None:
+            continue
+        results.append({
+            'policy_id': chunk.get('policy_id'),
+            'policy_name': chunk.get('policy_name'),
+            'effective_date': chunk.get('effective_date'),
+            'section': chunk.get('section'),
+            'page': chunk.get('page'),
+            'excerpt_id': chunk.get('id'),
+            'text': chunk.get('text'),
+            'score': float(scores[idx])
+        })
+    return results
 
 # Auth Routes
 @api_router.post("/auth/register", response_model=TokenResponse)
 async def register(user_data: UserCreate):
-    # Check if email exists
-    existing = await db.users.find_one({'email': user_data.email})
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    
     # Create organization if name provided
     org_id = None
     org_name = None
     if user_data.organization_name:
         org_id = str(uuid.uuid4())
         org_name = user_data.organization_name
-        await db.organizations.insert_one({
-            'id': org_id,
-            'name': org_name,
-            'created_at': datetime.now(timezone.utc).isoformat()
-        })
     
-    # Create user
+    # Reject known emails before paying for a bcrypt hash
+    if await db.users.find_one({'email': user_data.email}, {'_id': 1}):
+        raise HTTPException(status_code=400, detail="Email already registered")
+    
+    # Create user; the upsert still guards the insert against a registration racing past the probe
     user_id = str(uuid.uuid4())
     user_doc = {
         'id': user_id,
         'email': user_data.email,
-        'password_hash': hash_password(user_data.password),
+        'password_hash': await hash_password(user_data.password),
         'name': user_data.name,
         'organization_id': org_id,
         'organization_name': org_name,
         'created_at': datetime.now(timezone.utc).isoformat()
     }
-    await db.users.insert_one(user_doc)
+    try:
+        result = await db.users.update_one({'email': user_data.email}, {'$setOnInsert': user_doc}, upsert=True)
+    except DuplicateKeyError:
+        # A concurrent registration won the race on the unique email index
+        raise HTTPException(status_code=400, detail="Email already registered")
+    if result.matched_count:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    
+    if org_id:
+        await db.organizations.insert_one({
+            'id': org_id,
+            'name': org_name,
+            'created_at': user_doc['created_at']
+        })
     
     token = create_token(user_id, user_data.email)
     
@@ -309,7 +605,7 @@ async def register(user_data: UserCreate):
 @api_router.post("/auth/login", response_model=TokenResponse)
 async def login(credentials: UserLogin):
     user = await db.users.find_one({'email': credentials.email}, {'_id': 0})
-    if not user or not verify_password(credentials.password, user['password_hash']):
+    if not user or not await verify_password(credentials.password, user['password_hash']):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     token = create_token(user['id'], user['email'])
@@ -341,6 +637,7 @@ async def get_me(user=Depends(get_current_user)):
 @api_router.post("/cases")
 async def create_case(case_data: CaseCreate, user=Depends(get_current_user)):
     case_id = str(uuid.uuid4())
+    now_iso = datetime.now(timezone.utc).isoformat()
     case_doc = {
         'id': case_id,
         'user_id': user['id'],
@@ -360,8 +657,8 @@ async def create_case(case_data: CaseCreate, user=Depends(get_current_user)):
         'denial_analysis': {},
         'generated_draft': None,
         'documents': [],
-        'created_at': datetime.now(timezone.utc).isoformat(),
-        'updated_at': datetime.now(timezone.utc).isoformat()
+        'created_at': now_iso,
+        'updated_at': now_iso
     }
     await db.cases.insert_one(case_doc)
     await create_audit_log(user['id'], user.get('organization_id'), 'create_case', case_id, {'action': 'Case created'})
@@ -369,12 +666,27 @@ async def create_case(case_data: CaseCreate, user=Depends(get_current_user)):
     return {**case_doc, '_id': None}
 
 @api_router.get("/cases")
-async def get_cases(status: Optional[str] = None, user=Depends(get_current_user)):
+async def get_cases(
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    user=Depends(get_current_user)
+):
     query = {'organization_id': user.get('organization_id')}
     if status:
         query['status'] = status
-    
-    cases = await db.cases.find(query, {'_id': 0}).sort('created_at', -1).to_list(1000)
+    if search:
+        # Searched server-side so matches beyond the current page are found
+        pattern = {'$regex': re.escape(search), '$options': 'i'}
+        query['$or'] = [{'payer': pattern}, {'patient_name': pattern}, {'cpt_codes': pattern}]
+    
+    # List view fields only; extracted facts, policy matches and drafts come from GET /cases/{case_id}
+    projection = {
+        '_id': 0, 'id': 1, 'payer': 1, 'state': 1, 'status': 1, 'due_date': 1,
+        'patient_name': 1, 'created_at': 1, 'cpt_codes': 1
+    }
+    cases = await db.cases.find(query, projection).sort('created_at', -1).skip(offset).limit(limit).to_list(limit)
     return cases
 
 @api_router.get("/cases/{case_id}")
@@ -418,25 +730,23 @@ async def upload_document(
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
     
-    # Read file
-    file_bytes = await file.read()
+    # Save file
+    doc_id = str(uuid.uuid4())
+    file_path = UPLOAD_DIR / f"{doc_id}_{file.filename}"
+    await save_upload(file, file_path)
     
-    # Extract text based on file type
+    # Extract text based on file type, reading from disk
     extracted_text = ""
     if file.filename.lower().endswith('.pdf'):
-        extracted_text = extract_text_from_pdf(file_bytes)
+        extracted_text = await extract_text_from_pdf(str(file_path))
     elif file.filename.lower().endswith(('.png', '.jpg', '.jpeg', '.tiff', '.bmp')):
-        extracted_text = extract_text_from_image(file_bytes)
+        extracted_text = await extract_text_from_image(str(file_path))
     else:
+        file_bytes = await asyncio.to_thread(file_path.read_bytes)
         extracted_text = file_bytes.decode('utf-8', errors='ignore')
     
-    # Save file
-    doc_id = str(uuid.uuid4())
-    file_path = UPLOAD_DIR / f"{doc_id}_{file.filename}"
-    with open(file_path, 'wb') as f:
-        f.write(file_bytes)
-    
     # Create document record
+    now_iso = datetime.now(timezone.utc).isoformat()
     doc_record = {
         'id': doc_id,
         'case_id': case_id,
@@ -444,14 +754,14 @@ async def upload_document(
         'filename': file.filename,
         'file_path': str(file_path),
         'extracted_text': extracted_text,
-        'uploaded_at': datetime.now(timezone.utc).isoformat()
+        'uploaded_at': now_iso
     }
     await db.documents.insert_one(doc_record)
     
     # Update case documents list
     await db.cases.update_one(
         {'id': case_id},
-        {'$push': {'documents': doc_id}, '$set': {'updated_at': datetime.now(timezone.utc).isoformat()}}
+        {'$push': {'documents': doc_id}, '$set': {'updated_at': now_iso}}
     )
     
     await create_audit_log(user['id'], user.get('organization_id'), 'upload_document', case_id, {'document_type': document_type, 'filename': file.filename})
@@ -471,13 +781,14 @@ async def get_case_documents(case_id: str, user=Depends(get_current_user)):
 @api_router.post("/cases/{case_id}/extract")
 async def extract_facts(case_id: str, user=Depends(get_current_user)):
     """Extract structured facts from case documents using LLM."""
-    case = await db.cases.find_one({'id': case_id, 'organization_id': user.get('organization_id')})
+    # Fetch the case and its documents concurrently; documents are only used once the case check passes
+    case, documents = await asyncio.gather(
+        db.cases.find_one({'id': case_id, 'organization_id': user.get('organization_id')}, {'_id': 1}),
+        db.documents.find({'case_id': case_id}, {'_id': 0, 'type': 1, 'extracted_text': 1}).to_list(100)
+    )
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
     
-    # Get documents
-    documents = await db.documents.find({'case_id': case_id}, {'_id': 0}).to_list(100)
-    
     denial_text = ""
     clinical_text = ""
     imaging_text = ""
@@ -531,11 +842,8 @@ IMAGING REPORT:
     
     # Parse JSON from response
     try:
-        # Try to extract JSON from response
-        json_match = re.search(r'\{[\s\S]*\}', response)
-        if json_match:
-            extracted_facts = json.loads(json_match.group())
-        else:
+        extracted_facts = extract_json(response, '{')
+        if extracted_facts is None:
             extracted_facts = {"error": "Could not parse extraction", "raw_response": response[:500]}
     except json.JSONDecodeError:
         extracted_facts = {"error": "Invalid JSON in response", "raw_response": response[:500]}
@@ -593,7 +901,7 @@ async def analyze_denial(case_id: str, user=Depends(get_current_user)):
     extracted_facts = case.get('extracted_facts', {})
     policy_matches = case.get('policy_matches', [])
     
-    policy_excerpts = "\n".join([f"[{m.get('policy_name', 'Policy')} | {m.get('section', '')} | Page {m.get('page', '')}]: {m.get('text', '')[:500]}" for m in policy_matches[:5]])
+    policy_excerpts = "\n".join([f"[{m.get('policy_name', 'Policy')} | {m.get('section', '')} | Page {m.get('page', '')}]: {m.get('text', '')}" for m in policy_matches[:5]])
     
     system_prompt = """You are an administrative assistant for healthcare prior authorization and appeals. Generate a missing documentation checklist based on case facts and policy requirements.
 
@@ -615,24 +923,23 @@ Return JSON array:
     response = await call_llm(system_prompt, user_prompt)
     
     try:
-        json_match = re.search(r'\[[\s\S]*\]', response)
-        if json_match:
-            checklist = json.loads(json_match.group())
-        else:
+        checklist = extract_json(response, '[')
+        if checklist is None:
             checklist = [{"item": "Unable to generate checklist", "status": "Unknown", "notes": response[:200]}]
     except json.JSONDecodeError:
         checklist = [{"item": "Parse error", "status": "Unknown", "notes": response[:200]}]
     
+    now_iso = datetime.now(timezone.utc).isoformat()
     denial_analysis = {
         'denial_category': extracted_facts.get('denial_reason_category', 'unknown'),
         'denial_reasons': extracted_facts.get('denial_reasons', []),
         'missing_docs_checklist': checklist,
-        'analyzed_at': datetime.now(timezone.utc).isoformat()
+        'analyzed_at': now_iso
     }
     
     await db.cases.update_one(
         {'id': case_id},
-        {'$set': {'denial_analysis': denial_analysis, 'updated_at': datetime.now(timezone.utc).isoformat()}}
+        {'$set': {'denial_analysis': denial_analysis, 'updated_at': now_iso}}
     )
     
     await create_audit_log(user['id'], user.get('organization_id'), 'analyze_denial', case_id)
@@ -655,7 +962,7 @@ async def generate_appeal_draft(case_id: str, user=Depends(get_current_user)):
         'section': m.get('section', ''),
         'page': m.get('page', ''),
         'excerpt_id': m.get('excerpt_id', ''),
-        'text': m.get('text', '')[:500]
+        'text': m.get('text', '')
     } for m in policy_matches[:5]], indent=2)
     
     case_json = json.dumps({
@@ -710,10 +1017,8 @@ Return:
     response = await call_llm(system_prompt, user_prompt)
     
     try:
-        json_match = re.search(r'\{[\s\S]*\}', response)
-        if json_match:
-            draft_data = json.loads(json_match.group())
-        else:
+        draft_data = extract_json(response, '{')
+        if draft_data is None:
             draft_data = {
                 "reviewable": False,
                 "appeal_letter": response,
@@ -728,14 +1033,15 @@ Return:
             "citations_used": []
         }
     
+    now_iso = datetime.now(timezone.utc).isoformat()
     generated_draft = {
         **draft_data,
-        'generated_at': datetime.now(timezone.utc).isoformat()
+        'generated_at': now_iso
     }
     
     await db.cases.update_one(
         {'id': case_id},
-        {'$set': {'generated_draft': generated_draft, 'status': 'draft_appeal', 'updated_at': datetime.now(timezone.utc).isoformat()}}
+        {'$set': {'generated_draft': generated_draft, 'status': 'draft_appeal', 'updated_at': now_iso}}
     )
     
     await create_audit_log(user['id'], user.get('organization_id'), 'generate_draft', case_id)
@@ -754,9 +1060,10 @@ async def mark_reviewed(case_id: str, user=Depends(get_current_user)):
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
     
+    now_iso = datetime.now(timezone.utc).isoformat()
     await db.cases.update_one(
         {'id': case_id},
-        {'$set': {'reviewed': True, 'reviewed_at': datetime.now(timezone.utc).isoformat(), 'updated_at': datetime.now(timezone.utc).isoformat()}}
+        {'$set': {'reviewed': True, 'reviewed_at': now_iso, 'updated_at': now_iso}}
     )
     
     await create_audit_log(user['id'], user.get('organization_id'), 'mark_reviewed', case_id)
@@ -777,16 +1084,7 @@ async def export_case(case_id: str, format: str = "pdf", user=Depends(get_curren
     html_content = f"""
     <!DOCTYPE html>
     <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }}
-            .header {{ text-align: center; margin-bottom: 30px; border-bottom: 2px solid #0F766E; padding-bottom: 20px; }}
-            .disclaimer {{ background: #FEF3C7; padding: 15px; border-left: 4px solid #F59E0B; margin-bottom: 20px; font-size: 12px; }}
-            .content {{ white-space: pre-wrap; }}
-            .footer {{ margin-top: 30px; font-size: 11px; color: #666; border-top: 1px solid #ddd; padding-top: 15px; }}
-            .citation {{ background: #F0FDFA; padding: 3px 6px; font-size: 11px; }}
-        </style>
-    </head>
+    <head></head>
     <body>
         <div class="header">
             <h1>Appeal Letter</h1>
@@ -807,8 +1105,7 @@ async def export_case(case_id: str, format: str = "pdf", user=Depends(get_curren
     """
     
     try:
-        from weasyprint import HTML
-        pdf_bytes = HTML(string=html_content).write_pdf()
+        pdf_bytes = await run_in_pdf_pool(render_pdf, html_content)
         
         await create_audit_log(user['id'], user.get('organization_id'), 'export_case', case_id, {'format': format})
         
@@ -817,6 +1114,8 @@ async def export_case(case_id: str, format: str = "pdf", user=Depends(get_curren
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment; filename=appeal_letter_{case_id}.pdf"}
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"PDF export error: {e}")
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
@@ -854,19 +1153,17 @@ async def upload_policy_file(
     if not policy:
         raise HTTPException(status_code=404, detail="Policy not found")
     
-    file_bytes = await file.read()
+    # Save file
+    file_path = UPLOAD_DIR / f"policy_{policy_id}_{file.filename}"
+    await save_upload(file, file_path)
     
-    # Extract text
+    # Extract text, reading from disk
     if file.filename.lower().endswith('.pdf'):
-        content = extract_text_from_pdf(file_bytes)
+        content = await extract_text_from_pdf(str(file_path))
     else:
+        file_bytes = await asyncio.to_thread(file_path.read_bytes)
         content = file_bytes.decode('utf-8', errors='ignore')
     
-    # Save file
-    file_path = UPLOAD_DIR / f"policy_{policy_id}_{file.filename}"
-    with open(file_path, 'wb') as f:
-        f.write(file_bytes)
-    
     # Update policy
     await db.policies.update_one(
         {'id': policy_id},
@@ -878,54 +1175,83 @@ async def upload_policy_file(
     
     return {"message": "Policy file uploaded and indexed", "content_length": len(content)}
 
-async def index_policy_content(policy_id: str, name: str, payer: str, state: str, effective_date: str, content: str):
-    """Chunk and index policy content for RAG."""
-    # Delete existing chunks
-    await db.policy_chunks.delete_many({'policy_id': policy_id})
+def build_policy_chunks(
+    policy_id: str, name: str, payer: str, state: str, effective_date: str, content: str, existing_ids: set
+) -> Tuple[List[Dict], List[Dict]]:
+    """Chunk policy content and embed the chunks not already stored. Runs in a worker thread.
     
-    # Simple chunking by paragraphs/sections
+    Returns (all chunk docs, new chunk docs with their embeddings).
+    """
+    # Chunks fill the embedding model's input (less [CLS]/[SEP]) so each is embedded in full
+    max_tokens = embedding_model.max_seq_length - 2
     chunks = []
-    paragraphs = content.split('\n\n')
-    
-    current_section = "General"
-    page_num = 1
-    
-    for i, para in enumerate(paragraphs):
-        if len(para.strip()) < 50:
-            # Might be a section header
-            if para.strip():
-                current_section = para.strip()[:100]
-            continue
-        
-        # Estimate page number
-        if i > 0 and i % 10 == 0:
-            page_num += 1
-        
-        chunk_id = str(uuid.uuid4())
-        embedding = compute_embedding(para[:1000])
-        
-        chunk_doc = {
-            'id': chunk_id,
+    for section, page, text in chunk_policy_content(content, chunk_tokenizer, max_tokens, max_tokens // 8):
+        # Deterministic id: re-indexing unchanged content maps onto the existing chunk
+        chunk_key = f"{policy_id}:{len(chunks)}:{section}:{page}:{text}"
+        chunks.append({
+            'id': hashlib.sha1(chunk_key.encode('utf-8')).hexdigest(),
             'policy_id': policy_id,
             'policy_name': name,
             'payer': payer,
+            'payer_lc': payer.strip().lower(),
             'state': state,
+            'state_lc': state.strip().lower(),
             'effective_date': effective_date,
-            'section': current_section,
-            'page': page_num,
-            'text': para[:2000],
-            'embedding': embedding
-        }
-        chunks.append(chunk_doc)
+            'section': section,
+            'page': page,
+            'text': text
+        })
     
-    if chunks:
-        await db.policy_chunks.insert_many(chunks)
+    # Chunks that already exist are unchanged; only new ones are embedded, in one batched encode
+    new_chunks = [chunk_doc for chunk_doc in chunks if chunk_doc['id'] not in existing_ids]
+    embeddings = compute_embeddings_batch([chunk_doc['text'] for chunk_doc in new_chunks])
+    for chunk_doc, embedding in zip(new_chunks, embeddings):
+        chunk_doc.update(encode_embedding(embedding))
+    return chunks, new_chunks
+
+async def index_policy_content(policy_id: str, name: str, payer: str, state: str, effective_date: str, content: str):
+    """Chunk and index policy content for RAG."""
+    existing = await db.policy_chunks.find(
+        {'policy_id': policy_id, 'embedding_dtype': EMBEDDING_DTYPE}, {'_id': 0, 'id': 1}
+    ).to_list(None)
+    existing_ids = {chunk_doc['id'] for chunk_doc in existing}
+    
+    # Sentence splitting, tokenization and encoding are all CPU-bound; keep them off the event loop
+    chunks, new_chunks = await asyncio.to_thread(
+        build_policy_chunks, policy_id, name, payer, state, effective_date, content, existing_ids
+    )
+    chunk_ids = [chunk_doc['id'] for chunk_doc in chunks]
+    
+    if new_chunks:
+        await db.policy_chunks.bulk_write(
+            [ReplaceOne({'id': chunk_doc['id']}, chunk_doc, upsert=True) for chunk_doc in new_chunks],
+            ordered=False
+        )
+    # Prune chunks from the previous version of the policy
+    await db.policy_chunks.delete_many({'policy_id': policy_id, 'id': {'$nin': chunk_ids}})
+    invalidate_policy_index()
     
-    logging.info(f"Indexed {len(chunks)} chunks for policy {policy_id}")
+    logging.info(f"Indexed {len(chunks)} chunks for policy {policy_id} ({len(new_chunks)} new)")
 
 @api_router.get("/policies")
-async def get_policies(user=Depends(get_current_user)):
-    policies = await db.policies.find({'organization_id': user.get('organization_id')}, {'_id': 0, 'content': 0}).to_list(1000)
+async def get_policies(
+    search: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    user=Depends(get_current_user)
+):
+    query = {'organization_id': user.get('organization_id')}
+    if search:
+        # Searched server-side so matches beyond the current page are found
+        pattern = {'$regex': re.escape(search), '$options': 'i'}
+        query['$or'] = [{'name': pattern}, {'payer': pattern}, {'state': pattern}, {'category': pattern}]
+    
+    # Library view fields only; content and file paths come from GET /policies/{policy_id}
+    projection = {
+        '_id': 0, 'id': 1, 'name': 1, 'payer': 1, 'state': 1, 'effective_date': 1,
+        'category': 1, 'created_at': 1, 'updated_at': 1
+    }
+    policies = await db.policies.find(query, projection).sort('created_at', -1).skip(offset).limit(limit).to_list(limit)
     return policies
 
 @api_router.get("/policies/{policy_id}")
@@ -939,6 +1265,7 @@ async def get_policy(policy_id: str, user=Depends(get_current_user)):
 async def delete_policy(policy_id: str, user=Depends(get_current_user)):
     result = await db.policies.delete_one({'id': policy_id, 'organization_id': user.get('organization_id')})
     await db.policy_chunks.delete_many({'policy_id': policy_id})
+    invalidate_policy_index()
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Policy not found")
     return {"message": "Policy deleted"}
@@ -966,13 +1293,14 @@ async def get_templates(user=Depends(get_current_user)):
 
 @api_router.put("/templates/{template_id}")
 async def update_template(template_id: str, template_data: TemplateCreate, user=Depends(get_current_user)):
-    result = await db.templates.update_one(
+    template = await db.templates.find_one_and_update(
         {'id': template_id, 'organization_id': user.get('organization_id')},
-        {'$set': {**template_data.model_dump(), 'updated_at': datetime.now(timezone.utc).isoformat()}}
+        {'$set': {**template_data.model_dump(), 'updated_at': datetime.now(timezone.utc).isoformat()}},
+        projection={'_id': 0},
+        return_document=ReturnDocument.AFTER
     )
-    if result.matched_count == 0:
+    if template is None:
         raise HTTPException(status_code=404, detail="Template not found")
-    template = await db.templates.find_one({'id': template_id}, {'_id': 0})
     return template
 
 @api_router.delete("/templates/{template_id}")
@@ -987,19 +1315,17 @@ async def delete_template(template_id: str, user=Depends(get_current_user)):
 async def get_analytics_summary(user=Depends(get_current_user)):
     org_id = user.get('organization_id')
     
-    # Get case counts by status
+    # Get case counts by status and by payer in one aggregation
     pipeline = [
         {'$match': {'organization_id': org_id}},
-        {'$group': {'_id': '$status', 'count': {'$sum': 1}}}
-    ]
-    status_counts = await db.cases.aggregate(pipeline).to_list(100)
-    
-    # Get case counts by payer
-    payer_pipeline = [
-        {'$match': {'organization_id': org_id}},
-        {'$group': {'_id': '$payer', 'count': {'$sum': 1}}}
+        {'$facet': {
+            'status': [{'$group': {'_id': '$status', 'count': {'$sum': 1}}}],
+            'payer': [{'$group': {'_id': '$payer', 'count': {'$sum': 1}}}]
+        }}
     ]
-    payer_counts = await db.cases.aggregate(payer_pipeline).to_list(100)
+    result = (await reporting_cases.aggregate(pipeline).to_list(1))[0]
+    status_counts = result['status']
+    payer_counts = result['payer']
     
     # Calculate win rate
     total_resolved = sum(1 for s in status_counts if s['_id'] in ['won', 'lost'])
@@ -1021,7 +1347,7 @@ async def get_denial_type_analytics(user=Depends(get_current_user)):
         {'$match': {'organization_id': org_id, 'denial_analysis.denial_category': {'$exists': True}}},
         {'$group': {'_id': '$denial_analysis.denial_category', 'count': {'$sum': 1}}}
     ]
-    denial_types = await db.cases.aggregate(pipeline).to_list(100)
+    denial_types = await reporting_cases.aggregate(pipeline).to_list(100)
     
     return {'denial_types': {d['_id']: d['count'] for d in denial_types}}
 
@@ -1032,7 +1358,7 @@ async def get_audit_logs(case_id: Optional[str] = None, limit: int = 100, user=D
     if case_id:
         query['case_id'] = case_id
     
-    logs = await db.audit_logs.find(query, {'_id': 0}).sort('timestamp', -1).limit(limit).to_list(limit)
+    logs = await reporting_audit_logs.find(query, {'_id': 0}).sort('timestamp', -1).limit(limit).to_list(limit)
     return logs
 
 # Dashboard Stats
@@ -1040,20 +1366,27 @@ async def get_audit_logs(case_id: Optional[str] = None, limit: int = 100, user=D
 async def get_dashboard_stats(user=Depends(get_current_user)):
     org_id = user.get('organization_id')
     
-    # Count by status
-    new_denials = await db.cases.count_documents({'organization_id': org_id, 'status': 'new_denial'})
-    draft_appeals = await db.cases.count_documents({'organization_id': org_id, 'status': 'draft_appeal'})
-    submitted = await db.cases.count_documents({'organization_id': org_id, 'status': 'submitted'})
-    won = await db.cases.count_documents({'organization_id': org_id, 'status': 'won'})
-    lost = await db.cases.count_documents({'organization_id': org_id, 'status': 'lost'})
-    
-    # Due soon (within 7 days)
+    # Status buckets and due-soon count in a single aggregation round-trip
     seven_days = (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()
-    due_soon = await db.cases.count_documents({
-        'organization_id': org_id,
-        'status': {'$nin': ['won', 'lost', 'submitted']},
-        'due_date': {'$lte': seven_days}
-    })
+    pipeline = [
+        {'$match': {'organization_id': org_id}},
+        {'$facet': {
+            'by_status': [{'$group': {'_id': '$status', 'n': {'$sum': 1}}}],
+            'due_soon': [
+                {'$match': {'status': {'$nin': ['won', 'lost', 'submitted']}, 'due_date': {'$lte': seven_days}}},
+                {'$count': 'n'}
+            ]
+        }}
+    ]
+    result = (await reporting_cases.aggregate(pipeline).to_list(1))[0]
+    by_status = {s['_id']: s['n'] for s in result['by_status']}
+    due_soon = result['due_soon'][0]['n'] if result['due_soon'] else 0
+    
+    new_denials = by_status.get('new_denial', 0)
+    draft_appeals = by_status.get('draft_appeal', 0)
+    submitted = by_status.get('submitted', 0)
+    won = by_status.get('won', 0)
+    lost = by_status.get('lost', 0)
     
     return {
         'new_denials': new_denials,
@@ -1074,23 +1407,26 @@ async def seed_data():
     if existing:
         return {"message": "Data already seeded"}
     
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
+    
     # Create demo organization and user
     org_id = str(uuid.uuid4())
     await db.organizations.insert_one({
         'id': org_id,
         'name': 'Demo Specialty Clinic',
-        'created_at': datetime.now(timezone.utc).isoformat()
+        'created_at': now_iso
     })
     
     user_id = str(uuid.uuid4())
     await db.users.insert_one({
         'id': user_id,
         'email': 'demo@authpilot.com',
-        'password_hash': hash_password('demo123'),
+        'password_hash': await hash_password('demo123'),
         'name': 'Demo User',
         'organization_id': org_id,
         'organization_name': 'Demo Specialty Clinic',
-        'created_at': datetime.now(timezone.utc).isoformat()
+        'created_at': now_iso
     })
     
     # Create sample payers/policies
@@ -1156,22 +1492,22 @@ Appeals must include:
 - Peer-reviewed literature supporting coverage"""
     ]
     
-    for i, payer in enumerate(payers):
-        policy_id = str(uuid.uuid4())
-        await db.policies.insert_one({
-            'id': policy_id,
-            'organization_id': org_id,
-            'payer': payer['name'],
-            'state': payer['state'],
-            'effective_date': '2024-01-01',
-            'category': 'Medical Policy',
-            'name': f"{payer['name']} - {payer['state']} Policy",
-            'content': policy_contents[i],
-            'created_at': datetime.now(timezone.utc).isoformat()
-        })
-        
-        # Index policy content
-        await index_policy_content(policy_id, f"{payer['name']} - {payer['state']} Policy", payer['name'], payer['state'], '2024-01-01', policy_contents[i])
+    policy_docs = [{
+        'id': str(uuid.uuid4()),
+        'organization_id': org_id,
+        'payer': payer['name'],
+        'state': payer['state'],
+        'effective_date': '2024-01-01',
+        'category': 'Medical Policy',
+        'name': f"{payer['name']} - {payer['state']} Policy",
+        'content': policy_contents[i],
+        'created_at': now_iso
+    } for i, payer in enumerate(payers)]
+    await db.policies.insert_many(policy_docs)
+    
+    # Index one policy at a time; concurrent encodes would only compete for torch's intra-op threads
+    for p in policy_docs:
+        await index_policy_content(p['id'], p['name'], p['payer'], p['state'], p['effective_date'], p['content'])
     
     # Create sample cases
     cases = [
@@ -1181,7 +1517,7 @@ Appeals must include:
             'cpt_codes': ['72148'],
             'icd10_codes': ['M54.5'],
             'request_type': 'Appeal',
-            'due_date': (datetime.now(timezone.utc) + timedelta(days=14)).isoformat()[:10],
+            'due_date': (now + timedelta(days=14)).isoformat()[:10],
             'status': 'new_denial',
             'patient_name': 'John Smith',
         },
@@ -1191,7 +1527,7 @@ Appeals must include:
             'cpt_codes': ['E1390'],
             'icd10_codes': ['G47.33'],
             'request_type': 'Appeal',
-            'due_date': (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()[:10],
+            'due_date': (now + timedelta(days=7)).isoformat()[:10],
             'status': 'draft_appeal',
             'patient_name': 'Jane Doe',
         },
@@ -1201,27 +1537,25 @@ Appeals must include:
             'cpt_codes': ['70553'],
             'icd10_codes': ['G43.909'],
             'request_type': 'Appeal',
-            'due_date': (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()[:10],
+            'due_date': (now + timedelta(days=3)).isoformat()[:10],
             'status': 'new_denial',
             'patient_name': 'Robert Johnson',
         }
     ]
     
-    for case in cases:
-        case_id = str(uuid.uuid4())
-        await db.cases.insert_one({
-            'id': case_id,
-            'user_id': user_id,
-            'organization_id': org_id,
-            **case,
-            'extracted_facts': {},
-            'policy_matches': [],
-            'denial_analysis': {},
-            'generated_draft': None,
-            'documents': [],
-            'created_at': datetime.now(timezone.utc).isoformat(),
-            'updated_at': datetime.now(timezone.utc).isoformat()
-        })
+    await db.cases.insert_many([{
+        'id': str(uuid.uuid4()),
+        'user_id': user_id,
+        'organization_id': org_id,
+        **case,
+        'extracted_facts': {},
+        'policy_matches': [],
+        'denial_analysis': {},
+        'generated_draft': None,
+        'documents': [],
+        'created_at': now_iso,
+        'updated_at': now_iso
+    } for case in cases])
     
     # Create default templates
     templates = [
@@ -1239,13 +1573,12 @@ Appeals must include:
         }
     ]
     
-    for template in templates:
-        await db.templates.insert_one({
-            'id': str(uuid.uuid4()),
-            'organization_id': org_id,
-            **template,
-            'created_at': datetime.now(timezone.utc).isoformat()
-        })
+    await db.templates.insert_many([{
+        'id': str(uuid.uuid4()),
+        'organization_id': org_id,
+        **template,
+        'created_at': now_iso
+    } for template in templates])
     
     return {"message": "Seed data created", "demo_credentials": {"email": "demo@authpilot.com", "password": "demo123"}}
 
@@ -1268,6 +1601,70 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def startup_create_indexes():
+    # Backfill the normalized payer/state fields search_policies filters on; runs first so a
+    # failed index build below can never leave existing chunks invisible to search
+    try:
+        await db.policy_chunks.update_many(
+            {'payer_lc': {'$exists': False}},
+            [{'$set': {
+                'payer_lc': {'$trim': {'input': {'$toLower': '$payer'}}},
+                'state_lc': {'$trim': {'input': {'$toLower': '$state'}}}
+            }}]
+        )
+    except Exception as e:
+        logger.error(f"policy_chunks payer/state backfill error: {e}")
+    
+    indexes = [
+        # (organization_id, status, ...) also serves organization_id + status lookups
+        (db.cases, [('organization_id', 1), ('status', 1), ('created_at', -1)], {}),
+        (db.cases, [('organization_id', 1), ('created_at', -1)], {}),
+        (db.cases, [('organization_id', 1), ('payer', 1)], {}),
+        (db.cases, [('organization_id', 1), ('due_date', 1), ('status', 1)], {}),
+        (db.documents, [('case_id', 1)], {}),
+        (db.policies, [('organization_id', 1), ('created_at', -1)], {}),
+        (db.policy_chunks, [('payer_lc', 1), ('state_lc', 1)], {}),
+        (db.policy_chunks, [('id', 1)], {'unique': True}),
+        (db.policy_chunks, [('policy_id', 1)], {}),
+        # Fails while duplicate emails from before the upsert-based register remain
+        (db.users, [('email', 1)], {'unique': True}),
+        (db.audit_logs, [('organization_id', 1), ('timestamp', -1)], {}),
+        (db.audit_logs, [('organization_id', 1), ('case_id', 1), ('timestamp', -1)], {}),
+    ]
+    # Each index is built independently so one failed build does not skip the rest
+    for collection, keys, options in indexes:
+        try:
+            await collection.create_index(keys, **options)
+        except Exception as e:
+            logger.error(f"Index creation error on {collection.name} {keys}: {e}")
+
+@app.on_event("startup")
+async def startup_audit_drain():
+    global audit_drain_task
+    audit_drain_task = asyncio.create_task(drain_audit_queue())
+
+@app.on_event("startup")
+async def startup_load_embedding_model():
+    global embedding_model, chunk_tokenizer
+    embedding_model = load_embedding_model()
+    chunk_tokenizer = load_chunk_tokenizer(embedding_model)
+    logger.info("Embedding model loaded")
+
+@app.on_event("shutdown")
+async def shutdown_audit_drain():
+    # Let the drain task flush everything already queued before stopping it
+    try:
+        await asyncio.wait_for(audit_queue.join(), timeout=5)
+    except asyncio.TimeoutError:
+        logger.error(f"Audit log flush timed out with {audit_queue.qsize()} entries queued")
+    if audit_drain_task:
+        audit_drain_task.cancel()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
+
+@app.on_event("shutdown")
+async def shutdown_worker_pools():
+    PDF_POOL.shutdown(wait=False, cancel_futures=True)
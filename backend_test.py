@@ -1,6 +1,9 @@
 import requests
+from requests.adapters import HTTPAdapter
 import sys
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 class AuthPilotAPITester:
@@ -11,22 +14,55 @@ class AuthPilotAPITester:
         self.tests_run = 0
         self.tests_passed = 0
         self.test_results = []
+        self.results_lock = threading.Lock()
+        # Per-thread keep-alive session and output buffer for concurrently run tests
+        self.local = threading.local()
+
+    @property
+    def sess(self):
+        """Keep-alive session for the current thread; requests.Session is not documented as thread-safe"""
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({'Content-Type': 'application/json'})
+            session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+            self.local.session = session
+        return session
+
+    def emit(self, text):
+        """Print, or buffer while the current thread runs a test via run_buffered"""
+        lines = getattr(self.local, 'lines', None)
+        if lines is None:
+            print(text)
+        else:
+            lines.append(text)
+
+    def run_buffered(self, test):
+        """Run a test and print its output as one block, so concurrent tests don't interleave"""
+        self.local.lines = []
+        try:
+            return test()
+        finally:
+            with self.results_lock:
+                print("\n".join(self.local.lines))
+            self.local.lines = None
 
     def log_test(self, name, success, details=""):
         """Log test result"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-            print(f"✅ {name} - PASSED")
-        else:
-            print(f"❌ {name} - FAILED: {details}")
-        
-        self.test_results.append({
-            "test": name,
-            "success": success,
-            "details": details,
-            "timestamp": datetime.now().isoformat()
-        })
+        with self.results_lock:
+            self.tests_run += 1
+            if success:
+                self.tests_passed += 1
+                self.emit(f"✅ {name} - PASSED")
+            else:
+                self.emit(f"❌ {name} - FAILED: {details}")
+            
+            self.test_results.append({
+                "test": name,
+                "success": success,
+                "details": details,
+                "timestamp": datetime.now().isoformat()
+            })
 
     def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
         """Run a single API test"""
@@ -39,20 +75,20 @@ class AuthPilotAPITester:
         if headers:
             test_headers.update(headers)
 
-        print(f"\n🔍 Testing {name}...")
-        print(f"   URL: {url}")
+        self.emit(f"\n🔍 Testing {name}...")
+        self.emit(f"   URL: {url}")
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=test_headers, timeout=30)
+                response = self.sess.get(url, headers=test_headers, timeout=30)
             elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers, timeout=30)
+                response = self.sess.post(url, json=data, headers=test_headers, timeout=30)
             elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers, timeout=30)
+                response = self.sess.put(url, json=data, headers=test_headers, timeout=30)
             elif method == 'DELETE':
-                response = requests.delete(url, headers=test_headers, timeout=30)
+                response = self.sess.delete(url, headers=test_headers, timeout=30)
 
-            print(f"   Status: {response.status_code}")
+            self.emit(f"   Status: {response.status_code}")
             
             success = response.status_code == expected_status
             
@@ -101,7 +137,7 @@ class AuthPilotAPITester:
         if success and 'token' in response:
             self.token = response['token']
             self.user_id = response.get('user', {}).get('id')
-            print(f"   Token obtained: {self.token[:20]}...")
+            self.emit(f"   Token obtained: {self.token[:20]}...")
             return True
         return False
 
@@ -125,7 +161,7 @@ class AuthPilotAPITester:
         )
         
         if success:
-            print(f"   Stats: {response}")
+            self.emit(f"   Stats: {response}")
         return success
 
     def test_get_cases(self):
@@ -138,7 +174,7 @@ class AuthPilotAPITester:
         )
         
         if success:
-            print(f"   Found {len(response)} cases")
+            self.emit(f"   Found {len(response)} cases")
             return response
         return []
 
@@ -152,7 +188,7 @@ class AuthPilotAPITester:
         )
         
         if success:
-            print(f"   Found {len(response)} policies")
+            self.emit(f"   Found {len(response)} policies")
         return success
 
     def test_get_templates(self):
@@ -165,7 +201,7 @@ class AuthPilotAPITester:
         )
         
         if success:
-            print(f"   Found {len(response)} templates")
+            self.emit(f"   Found {len(response)} templates")
         return success
 
     def test_analytics_summary(self):
@@ -178,7 +214,7 @@ class AuthPilotAPITester:
         )
         
         if success:
-            print(f"   Analytics: {response}")
+            self.emit(f"   Analytics: {response}")
         return success
 
     def test_analytics_denial_types(self):
@@ -194,11 +230,11 @@ class AuthPilotAPITester:
     def test_case_operations(self, cases):
         """Test case-specific operations"""
         if not cases:
-            print("⚠️  No cases available for testing case operations")
+            self.emit("⚠️  No cases available for testing case operations")
             return False
         
         case_id = cases[0]['id']
-        print(f"\n🔍 Testing case operations with case: {case_id}")
+        self.emit(f"\n🔍 Testing case operations with case: {case_id}")
         
         # Test get specific case
         success, _ = self.run_test(
@@ -267,20 +303,19 @@ class AuthPilotAPITester:
             print("❌ Get user info failed")
             return False
         
-        # Test 3: Dashboard and Stats
-        print("\n📈 DASHBOARD TESTS")
-        self.test_dashboard_stats()
-        
-        # Test 4: Core Data Retrieval
-        print("\n📋 DATA RETRIEVAL TESTS")
-        cases = self.test_get_cases()
-        self.test_get_policies()
-        self.test_get_templates()
-        
-        # Test 5: Analytics
-        print("\n📊 ANALYTICS TESTS")
-        self.test_analytics_summary()
-        self.test_analytics_denial_types()
+        # Tests 3-5: Dashboard, core data retrieval and analytics are independent reads,
+        # so they run concurrently, each thread on its own keep-alive session
+        print("\n📈 DASHBOARD, DATA RETRIEVAL AND ANALYTICS TESTS")
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            cases_future = pool.submit(self.run_buffered, self.test_get_cases)
+            futures = [pool.submit(self.run_buffered, test) for test in (
+                self.test_dashboard_stats, self.test_get_policies, self.test_get_templates,
+                self.test_analytics_summary, self.test_analytics_denial_types
+            )]
+        cases = cases_future.result()
+        # Re-raise any exception from the concurrent tests instead of losing it
+        for future in futures:
+            future.result()
         
         # Test 6: Case Operations
         print("\n📁 CASE OPERATIONS TESTS")
@@ -37,6 +37,7 @@ import { toast } from 'sonner';
 import { format, parseISO, differenceInDays } from 'date-fns';
 
 const API = `${process.env.REACT_APP_BACKEND_URL}/api`;
+const PAGE_SIZE = 50;
 
 const statusConfig = {
   new_denial: { label: 'New Denial', icon: AlertCircle, className: 'status-new-denial' },
@@ -51,21 +52,35 @@ const Dashboard = () => {
   const [cases, setCases] = useState([]);
   const [stats, setStats] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [hasMore, setHasMore] = useState(false);
   const [filter, setFilter] = useState('all');
   const [search, setSearch] = useState('');
 
   useEffect(() => {
-    fetchData();
-  }, [filter]);
+    // Search runs on the server, so wait for typing to pause before refetching
+    const timer = setTimeout(fetchData, search ? 300 : 0);
+    return () => clearTimeout(timer);
+  }, [filter, search]);
+
+  const fetchCases = (offset) => axios.get(`${API}/cases`, {
+    params: {
+      status: filter !== 'all' ? filter : undefined,
+      search: search || undefined,
+      limit: PAGE_SIZE,
+      offset,
+    }
+  });
 
   const fetchData = async () => {
     setLoading(true);
     try {
       const [casesRes, statsRes] = await Promise.all([
-        axios.get(`${API}/cases${filter !== 'all' ? `?status=${filter}` : ''}`),
+        fetchCases(0),
         axios.get(`${API}/dashboard/stats`)
       ]);
       setCases(casesRes.data);
+      setHasMore(casesRes.data.length === PAGE_SIZE);
       setStats(statsRes.data);
     } catch (error) {
       toast.error('Failed to load dashboard data');
@@ -75,15 +90,19 @@ const Dashboard = () => {
     }
   };
 
-  const filteredCases = cases.filter(c => {
-    if (!search) return true;
-    const searchLower = search.toLowerCase();
-    return (
-      c.payer?.toLowerCase().includes(searchLower) ||
-      c.patient_name?.toLowerCase().includes(searchLower) ||
-      c.cpt_codes?.some(code => code.toLowerCase().includes(searchLower))
-    );
-  });
+  const loadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const response = await fetchCases(cases.length);
+      setCases(prev => [...prev, ...response.data]);
+      setHasMore(response.data.length === PAGE_SIZE);
+    } catch (error) {
+      toast.error('Failed to load more cases');
+      console.error(error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   const getDueSoonStatus = (dueDate) => {
     if (!dueDate) return null;
@@ -223,7 +242,7 @@ const Dashboard = () => {
             <div className="flex items-center justify-center py-12">
               <div className="spinner w-8 h-8" />
             </div>
-          ) : filteredCases.length === 0 ? (
+          ) : cases.length === 0 ? (
             <div className="flex flex-col items-center justify-center py-12 text-center">
               <img 
                 src="https://images.unsplash.com/photo-1758691461888-b74515208d7a?crop=entropy&cs=srgb&fm=jpg&q=85&w=400"
@@ -253,7 +272,7 @@ const Dashboard = () => {
                 </TableRow>
               </TableHeader>
               <TableBody>
-                {filteredCases.map((caseItem, index) => {
+                {cases.map((caseItem, index) => {
                   const status = statusConfig[caseItem.status] || statusConfig.new_denial;
                   const StatusIcon = status.icon;
                   const dueSoon = getDueSoonStatus(caseItem.due_date);
@@ -263,7 +282,7 @@ const Dashboard = () => {
                       key={caseItem.id}
                       className="table-row-hover cursor-pointer"
                       onClick={() => navigate(`/cases/${caseItem.id}`)}
-                      style={{ animationDelay: `${index * 50}ms` }}
+                      style={{ animationDelay: `${(index % PAGE_SIZE) * 50}ms` }}
                       data-testid={`case-row-${caseItem.id}`}
                     >
                       <TableCell>
@@ -325,6 +344,18 @@ const Dashboard = () => {
               </TableBody>
             </Table>
           )}
+          {!loading && hasMore && (
+            <div className="flex justify-center border-t border-slate-100 py-4">
+              <Button
+                variant="outline"
+                onClick={loadMore}
+                disabled={loadingMore}
+                data-testid="load-more-cases-btn"
+              >
+                {loadingMore ? 'Loading...' : 'Load more cases'}
+              </Button>
+            </div>
+          )}
         </CardContent>
       </Card>
     </div>
@@ -46,6 +46,7 @@ import { toast } from 'sonner';
 import { format, parseISO } from 'date-fns';
 
 const API = `${process.env.REACT_APP_BACKEND_URL}/api`;
+const PAGE_SIZE = 50;
 
 const CATEGORIES = [
   'Medical Policy',
@@ -61,6 +62,8 @@ const CATEGORIES = [
 const PolicyLibrary = () => {
   const [policies, setPolicies] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [hasMore, setHasMore] = useState(false);
   const [showAddDialog, setShowAddDialog] = useState(false);
   const [search, setSearch] = useState('');
   const [uploading, setUploading] = useState(false);
@@ -77,14 +80,21 @@ const PolicyLibrary = () => {
   const [file, setFile] = useState(null);
 
   useEffect(() => {
-    fetchPolicies();
-  }, []);
+    // Search runs on the server, so wait for typing to pause before refetching
+    const timer = setTimeout(fetchPolicies, search ? 300 : 0);
+    return () => clearTimeout(timer);
+  }, [search]);
+
+  const fetchPolicyPage = (offset) => axios.get(`${API}/policies`, {
+    params: { search: search || undefined, limit: PAGE_SIZE, offset }
+  });
 
   const fetchPolicies = async () => {
     setLoading(true);
     try {
-      const response = await axios.get(`${API}/policies`);
+      const response = await fetchPolicyPage(0);
       setPolicies(response.data);
+      setHasMore(response.data.length === PAGE_SIZE);
     } catch (error) {
       toast.error('Failed to load policies');
     } finally {
@@ -92,6 +102,19 @@ const PolicyLibrary = () => {
     }
   };
 
+  const loadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const response = await fetchPolicyPage(policies.length);
+      setPolicies(prev => [...prev, ...response.data]);
+      setHasMore(response.data.length === PAGE_SIZE);
+    } catch (error) {
+      toast.error('Failed to load more policies');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleInputChange = (field, value) => {
     setFormData(prev => ({ ...prev, [field]: value }));
   };
@@ -140,17 +163,6 @@ const PolicyLibrary = () => {
     }
   };
 
-  const filteredPolicies = policies.filter(p => {
-    if (!search) return true;
-    const searchLower = search.toLowerCase();
-    return (
-      p.name?.toLowerCase().includes(searchLower) ||
-      p.payer?.toLowerCase().includes(searchLower) ||
-      p.state?.toLowerCase().includes(searchLower) ||
-      p.category?.toLowerCase().includes(searchLower)
-    );
-  });
-
   return (
     <div className="space-y-6 animate-fade-in" data-testid="policy-library-page">
       {/* Header */}
@@ -312,7 +324,7 @@ const PolicyLibrary = () => {
             <div className="flex items-center justify-center py-12">
               <div className="spinner w-8 h-8" />
             </div>
-          ) : filteredPolicies.length === 0 ? (
+          ) : policies.length === 0 ? (
             <div className="text-center py-12">
               <BookOpen className="w-12 h-12 mx-auto text-slate-300 mb-4" />
               <h3 className="text-lg font-semibold text-slate-700">No policies found</h3>
@@ -331,7 +343,7 @@ const PolicyLibrary = () => {
                 </TableRow>
               </TableHeader>
               <TableBody>
-                {filteredPolicies.map((policy) => (
+                {policies.map((policy) => (
                   <TableRow key={policy.id} className="table-row-hover" data-testid={`policy-row-${policy.id}`}>
                     <TableCell>
                       <div className="flex items-center gap-2">
@@ -376,6 +388,18 @@ const PolicyLibrary = () => {
               </TableBody>
             </Table>
           )}
+          {!loading && hasMore && (
+            <div className="flex justify-center border-t border-slate-100 py-4">
+              <Button
+                variant="outline"
+                onClick={loadMore}
+                disabled={loadingMore}
+                data-testid="load-more-policies-btn"
+              >
+                {loadingMore ? 'Loading...' : 'Load more policies'}
+              </Button>
+            </div>
+          )}
         </CardContent>
       </Card>
     </div>
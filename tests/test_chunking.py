@@ -0,0 +1,119 @@
+import re
+
+from chunking import chunk_policy_content, chunk_sentences, split_sentences
+
+
+def stub_tokenizer(texts, add_special_tokens=False, return_offsets_mapping=False):
+    """Splits each whitespace-separated word into tokens of up to 3 characters, like subword pieces."""
+    input_ids, offset_mapping = [], []
+    for text in texts:
+        spans = [
+            (m.start() + k, min(m.start() + k + 3, m.end()))
+            for m in re.finditer(r'\S+', text)
+            for k in range(0, m.end() - m.start(), 3)
+        ]
+        input_ids.append([text[a:b] for a, b in spans])
+        offset_mapping.append(spans)
+    encoded = {'input_ids': input_ids}
+    if return_offsets_mapping:
+        encoded['offset_mapping'] = offset_mapping
+    return encoded
+
+
+def sentence(n_words, tag):
+    """A sentence of n_words single-token words."""
+    return ' '.join(f"{tag}{i}" for i in range(n_words - 1)) + f" {tag}z. "
+
+
+def n_tokens(text):
+    return len(stub_tokenizer([text])['input_ids'][0])
+
+
+def test_split_sentences_keeps_separators():
+    text = "Prior auth is required. Imaging follows therapy!\n- Item one\n- Item two. Done?"
+    assert split_sentences(text) == [
+        "Prior auth is required. ",
+        "Imaging follows therapy!\n",
+        "- Item one\n",
+        "- Item two. ",
+        "Done?",
+    ]
+
+
+def test_chunks_respect_budget_and_sentence_boundaries():
+    sentences = [sentence(4, tag) for tag in 'abcdef']
+    chunks = chunk_sentences(sentences, stub_tokenizer, max_tokens=10, overlap_tokens=0)
+
+    assert [start for start, _ in chunks] == [0, 2, 4]
+    for start, text in chunks:
+        assert n_tokens(text) <= 10
+        # Chunks start on a sentence boundary
+        assert text.startswith(sentences[start].strip().split()[0])
+
+
+def test_overlap_carries_trailing_sentence():
+    sentences = [sentence(4, tag) for tag in 'abcd']
+    chunks = chunk_sentences(sentences, stub_tokenizer, max_tokens=10, overlap_tokens=4)
+
+    assert [start for start, _ in chunks] == [0, 1, 2]
+    # Each chunk after the first repeats the previous chunk's last sentence
+    for (_, previous), (_, text) in zip(chunks, chunks[1:]):
+        assert text.split('. ')[0] == previous.split('. ')[-1].rstrip('.')
+
+
+def test_overlap_dropped_when_it_would_overflow_the_budget():
+    sentences = [sentence(4, 'a'), sentence(9, 'b')]
+    chunks = chunk_sentences(sentences, stub_tokenizer, max_tokens=10, overlap_tokens=4)
+
+    assert chunks == [(0, sentences[0].strip()), (1, sentences[1].strip())]
+
+
+def test_oversize_sentence_split_on_words_within_budget():
+    long_sentence = sentence(25, 'w')
+    chunks = chunk_sentences([long_sentence], stub_tokenizer, max_tokens=10, overlap_tokens=0)
+
+    assert [n_tokens(text) for _, text in chunks] == [10, 10, 5]
+    assert all(start == 0 for start, _ in chunks)
+    assert ' '.join(text for _, text in chunks) == long_sentence.strip()
+
+
+def test_oversize_run_without_spaces_splits_on_tokens_with_no_empty_chunks():
+    long_run = 'a' * 30 + '. '
+    chunks = chunk_sentences([long_run], stub_tokenizer, max_tokens=10, overlap_tokens=0)
+
+    # 31 characters are 11 stub tokens: one full piece of 10, then the trailing "."
+    assert [text for _, text in chunks] == ['a' * 30, '.']
+    assert all(text for _, text in chunks)
+
+
+def test_oversize_form_line_pieces_stay_within_budget():
+    form_line = "Physician signature: " + '_' * 40 + " Date: " + '_' * 12 + '.'
+    chunks = chunk_sentences([form_line], stub_tokenizer, max_tokens=10, overlap_tokens=0)
+
+    assert all(text.strip() for _, text in chunks)
+    assert all(n_tokens(text) <= 10 for _, text in chunks)
+    assert ''.join(text for _, text in chunks).replace(' ', '') == form_line.replace(' ', '')
+
+
+def test_header_only_section_yields_no_chunks():
+    body = "Prior authorization is required for all advanced imaging services."
+    content = "\n\n".join([
+        "Section 1: Empty",
+        "Section 2: Coverage Criteria",
+        body,
+    ])
+    chunks = chunk_policy_content(content, stub_tokenizer, max_tokens=50, overlap_tokens=5)
+
+    assert chunks == [("Section 2: Coverage Criteria", 1, body)]
+
+
+def test_leading_text_is_general_and_pages_are_estimated():
+    paragraph = "Members must complete six weeks of conservative therapy first."
+    content = "\n\n".join([paragraph] * 12)
+    chunks = chunk_policy_content(content, stub_tokenizer, max_tokens=1000, overlap_tokens=0)
+
+    assert len(chunks) == 1
+    section, page, text = chunks[0]
+    assert section == "General"
+    assert page == 1
+    assert text.count(paragraph) == 12
@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from llm_json import extract_json
+
+
+def test_parses_value_wrapped_in_prose():
+    text = 'Here are the facts:\n```json\n{"payer_name": "Aetna", "codes": ["72148"]}\n```\nDone.'
+    assert extract_json(text, '{') == {"payer_name": "Aetna", "codes": ["72148"]}
+
+
+def test_returns_none_without_opener():
+    assert extract_json("No JSON here", '{') is None
+
+
+def test_skips_balanced_non_json_before_the_value():
+    text = 'Fill in {placeholder} fields. Result: {"status": "ok"}'
+    assert extract_json(text, '{') == {"status": "ok"}
+
+
+def test_truncated_object_does_not_return_nested_fragment():
+    text = '{"payer_name": "Aetna", "dates": {"denial_date": "2024-01-02"}, "key_clinical_facts": ["x'
+    with pytest.raises(json.JSONDecodeError):
+        extract_json(text, '{')
+
+
+def test_truncated_array_does_not_return_nested_fragment():
+    text = '[{"item": "Letter of medical necessity", "notes": ["a"], "x'
+    with pytest.raises(json.JSONDecodeError):
+        extract_json(text, '[')
+
+
+def test_brackets_inside_strings_are_ignored():
+    text = '{"notes": "see [1] and {2}", "bad": } then {"ok": true}'
+    assert extract_json(text, '{') == {"ok": True}